@@ -0,0 +1,39 @@
+"""
+Base class for the Databricks API clients.
+"""
+from typing import Dict, Optional
+
+import orjson
+
+from _config import HOST
+from _http import get_session
+
+
+class BaseDatabricksClient:
+    """
+    Shared setup for every Databricks client: the process-wide session
+    (which checks the credentials) and the endpoint's base URL.
+
+    Subclasses set API_PATH (e.g. "/api/2.1/unity-catalog/catalogs") and
+    issue calls relative to it with request().
+    """
+
+    API_PATH = ""
+
+    def __init__(self):
+        self.session = get_session()
+        self.host = HOST
+        self.base_url = f"{self.host}{self.API_PATH}"
+
+    def request(self, method: str, path: str = "", json: Optional[Dict] = None, **kwargs) -> Dict:
+        """
+        Calls `base_url + path` and returns the decoded JSON body ({} if empty).
+        The `json` payload and the response are (de)serialized with orjson.
+        """
+        if json is not None:
+            kwargs["data"] = orjson.dumps(json)
+        response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+        response.raise_for_status()
+        if not response.content:
+            return {}
+        return orjson.loads(response.content)
@@ -0,0 +1,93 @@
+"""
+Small in-process TTL cache for Databricks API responses.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import requests
+
+# Lookups of a single catalog/schema/table
+INFO_CACHE_MAXSIZE = 1024
+INFO_CACHE_TTL_SECONDS = 30
+# Missing objects are remembered for less time, so a newly created one shows up quickly
+NOT_FOUND_TTL_SECONDS = 5
+# First-page catalog listings and the warehouse list, which change on the order of minutes
+LIST_CACHE_TTL_SECONDS = 60
+
+
+class TTLCache:
+    """Thread-safe dict whose entries expire `ttl` seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Caches `value` under `key` for `ttl` seconds (default: the cache's TTL)."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (expires_at, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes `key` from the cache, returning its value if present."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self) -> None:
+        # Drop expired entries first, then the oldest ones (dicts keep insertion order)
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+            del self._data[key]
+        while len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+
+
+class _NotFound:
+    """Negative cache entry: the API answered 404 for this key."""
+
+    def __init__(self, response: requests.Response):
+        self.response = response
+
+
+def cached_lookup(cache: TTLCache, key: Hashable, fetch: Callable[[], Any]) -> Any:
+    """
+    Returns `fetch()` through `cache`. A 404 from the API is cached for
+    NOT_FOUND_TTL_SECONDS and re-raised as an HTTPError on later hits.
+    """
+    hit = cache.get(key)
+    if isinstance(hit, _NotFound):
+        raise requests.exceptions.HTTPError(f"404 Not Found (cached): {key}", response=hit.response)
+    if hit is not None:
+        return hit
+    try:
+        value = fetch()
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            cache.set(key, _NotFound(e.response), ttl=NOT_FOUND_TTL_SECONDS)
+        raise
+    cache.set(key, value)
+    return value
@@ -0,0 +1,10 @@
+"""
+Databricks connection settings, read once from the environment.
+
+main.py loads .env and applies the command-line overrides before any client
+module (and therefore this one) is imported.
+"""
+import os
+
+HOST = os.getenv("DATABRICKS_HOST")
+TOKEN = os.getenv("DATABRICKS_TOKEN")
@@ -0,0 +1,37 @@
+"""
+Error handling shared by the MCP tools.
+"""
+import functools
+from typing import Any, Callable
+
+import requests
+
+
+def error_detail(e: Exception) -> Any:
+    """
+    Describes a failed request: the API's error body when the failure carries
+    a response (cached 404s keep the original one), otherwise the exception text.
+    """
+    response = getattr(e, "response", None)
+    if response is None:
+        return str(e)
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+def handle_databricks_errors(action: str) -> Callable:
+    """
+    Decorator for MCP tools: turns request failures into a single
+    "Failed to <action>: ..." error, using the API's error body when present.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                raise Exception(f"Failed to {action}: {error_detail(e)}")
+        return wrapper
+    return decorator
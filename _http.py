@@ -0,0 +1,128 @@
+"""
+Shared HTTP session, retry policy and worker pool for all Databricks clients.
+
+Every client module talks to the same DATABRICKS_HOST, so they share one
+process-wide requests.Session and, with it, one pool of warm keep-alive
+connections. Concurrent lookups (fetch_many) run on one process-wide
+thread pool sized to match it.
+"""
+import time
+import concurrent.futures
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _config import HOST, TOKEN
+from _errors import error_detail
+
+# Retry policy for transient failures and rate limiting (HTTP 429)
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# POST and PATCH are not idempotent (statement submission, create_*, warehouse
+# start, renames): they are only retried when the server rejected them without
+# processing them
+NON_IDEMPOTENT_METHODS = ("POST", "PATCH")
+NON_IDEMPOTENT_RETRY_STATUS_CODES = (429, 503)
+
+# Worker threads for concurrent requests (must not exceed the pool size below)
+MAX_WORKERS = 16
+
+_session: Optional[requests.Session] = None
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+class _Retry(Retry):
+    """Retry that also retries POST and PATCH, but only on NON_IDEMPOTENT_RETRY_STATUS_CODES."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() in NON_IDEMPOTENT_METHODS:
+            return status_code in NON_IDEMPOTENT_RETRY_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def build_retry() -> Retry:
+    """
+    Exponential-backoff retry policy that honours Retry-After.
+
+    POST and PATCH are left out of allowed_methods so a read timeout never
+    resubmits a request the server may already have processed. Once retries
+    run out the last response is returned, so raise_for_status() still reports
+    the API's error body instead of a RetryError.
+    """
+    return _Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=["GET", "DELETE"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def retry_delay(headers: Mapping[str, str], attempt: int) -> float:
+    """
+    Seconds to wait before retry number `attempt` (0-based).
+
+    Uses the server's Retry-After header when present (seconds or HTTP date),
+    otherwise the same exponential backoff as build_retry().
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return BACKOFF_FACTOR * (2 ** attempt)
+
+
+def get_session() -> requests.Session:
+    """Lazily builds and returns the process-wide requests.Session."""
+    global _session
+    if _session is None:
+        if not HOST or not TOKEN:
+            raise ValueError("DATABRICKS_HOST and DATABRICKS_TOKEN environment variables are required")
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {TOKEN}",
+            "Content-Type": "application/json",
+        })
+        session.mount(HOST, HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=build_retry(),
+        ))
+        # Any other HTTPS host (e.g. pre-signed result links) gets the same retry policy
+        session.mount("https://", HTTPAdapter(pool_maxsize=MAX_WORKERS, max_retries=build_retry()))
+        _session = session
+    return _session
+
+
+def get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Lazily builds and returns the process-wide thread pool."""
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    return _executor
+
+
+def fetch_many(fetch: Callable[[str], Dict], keys: List[str]) -> Dict[str, Dict]:
+    """
+    Calls `fetch` for every key concurrently on the shared thread pool and
+    returns the results keyed by name. A failed lookup is reported as
+    {"error": ...} for its key instead of failing the whole batch.
+    """
+    def fetch_one(key: str) -> Dict:
+        try:
+            return fetch(key)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return {"error": error_detail(e)}
+
+    unique_keys = list(dict.fromkeys(keys))
+    return dict(zip(unique_keys, get_executor().map(fetch_one, unique_keys)))
@@ -0,0 +1,70 @@
+"""
+Request payloads for the Databricks API, built with Pydantic.
+"""
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class Payload(BaseModel):
+    """Base payload: empty values are treated as not provided and left out of the body."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _empty_as_unset(cls, value: Any) -> Any:
+        return None if value in ("", {}) else value
+
+    def to_json(self) -> str:
+        """Serializes only the fields that were set to a non-empty value."""
+        return self.model_dump_json(exclude_defaults=True, exclude_none=True)
+
+
+class CatalogCreate(Payload):
+    name: str
+    comment: Optional[str] = None
+    connection_name: Optional[str] = None
+    options: Optional[Dict[str, str]] = None
+    properties: Optional[Dict[str, str]] = None
+    provider_name: Optional[str] = None
+    share_name: Optional[str] = None
+    storage_root: Optional[str] = None
+
+
+class SchemaCreate(Payload):
+    catalog_name: str
+    name: str
+    comment: Optional[str] = None
+    properties: Optional[Dict[str, str]] = None
+
+
+class SchemaUpdate(Payload):
+    new_name: Optional[str] = None
+    comment: Optional[str] = None
+    properties: Optional[Dict[str, str]] = None
+
+
+class TableCreate(Payload):
+    # Other table attributes accepted by the API are passed through as-is
+    model_config = ConfigDict(extra="allow")
+
+    catalog_name: str
+    schema_name: str
+    name: str
+    table_type: Optional[str] = None
+    data_source_format: Optional[str] = None
+    columns: Optional[List[Dict[str, Any]]] = None
+    storage_location: Optional[str] = None
+    comment: Optional[str] = None
+    properties: Optional[Dict[str, str]] = None
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.catalog_name}.{self.schema_name}.{self.name}"
+
+
+class TableUpdate(Payload):
+    model_config = ConfigDict(extra="allow")
+
+    owner: Optional[str] = None
@@ -0,0 +1,49 @@
+"""
+Pagination helpers for the Unity Catalog list endpoints.
+"""
+from typing import Dict, Iterator, Optional
+
+import orjson
+
+from _http import get_session
+
+# Largest page size accepted by the Unity Catalog list endpoints
+MAX_PAGE_SIZE = 1000
+# Pages a list tool collects before handing back a next_page_token
+DEFAULT_MAX_PAGES = 10
+
+
+def iter_pages(url: str, params: Optional[Dict] = None, page_token: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Yields every page of a Unity Catalog list endpoint, following
+    next_page_token and requesting the largest page size on each call.
+    """
+    params = dict(params or {}, max_results=MAX_PAGE_SIZE)
+    while True:
+        if page_token:
+            params["page_token"] = page_token
+        response = get_session().get(url, params=params)
+        response.raise_for_status()
+        page = orjson.loads(response.content)
+        yield page
+        page_token = page.get("next_page_token")
+        if not page_token:
+            return
+
+
+def collect_pages(pages: Iterator[Dict], items_key: str, max_pages: int = DEFAULT_MAX_PAGES) -> Dict:
+    """
+    Merges up to `max_pages` pages into a single response. If more pages
+    remain, their next_page_token is returned so the caller can resume.
+    """
+    items = []
+    next_page_token = None
+    for count, page in enumerate(pages, start=1):
+        items.extend(page.get(items_key, []))
+        next_page_token = page.get("next_page_token")
+        if count >= max_pages:
+            break
+    result = {items_key: items}
+    if next_page_token:
+        result["next_page_token"] = next_page_token
+    return result
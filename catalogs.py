@@ -2,81 +2,84 @@
 Databricks Catalogs Module: CRUD operations for Unity Catalog catalogs.
 """
 
-from typing import List, Dict, Optional
-import requests
-import os
-from dotenv import load_dotenv
+from typing import List, Dict, Iterator, Optional
 from mcp.server.fastmcp import FastMCP
 
-# Load environment variables
-load_dotenv()
+from _base import BaseDatabricksClient
+from _cache import INFO_CACHE_MAXSIZE, INFO_CACHE_TTL_SECONDS, LIST_CACHE_TTL_SECONDS, TTLCache, cached_lookup
+from _errors import handle_databricks_errors
+from _models import CatalogCreate
+from _paging import DEFAULT_MAX_PAGES, collect_pages, iter_pages
+
+
+class DatabricksCatalogClient(BaseDatabricksClient):
+    API_PATH = "/api/2.1/unity-catalog/catalogs"
 
-class DatabricksCatalogClient:
     def __init__(self):
-        self.host = os.getenv("DATABRICKS_HOST")
-        self.token = os.getenv("DATABRICKS_TOKEN")
-        if not self.host or not self.token:
-            raise ValueError("DATABRICKS_HOST and DATABRICKS_TOKEN environment variables are required")
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
-
-    def list_catalogs(self, page_token: Optional[str] = None) -> Dict:
-        """List all catalogs in the Databricks workspace, with pagination support."""
-        url = f"{self.host}/api/2.1/unity-catalog/catalogs"
-        params = {}
+        super().__init__()
+        self.list_cache = TTLCache(maxsize=8, ttl=LIST_CACHE_TTL_SECONDS)
+        self.info_cache = TTLCache(maxsize=INFO_CACHE_MAXSIZE, ttl=INFO_CACHE_TTL_SECONDS)
+
+    def list_catalogs(self, page_token: Optional[str] = None, max_pages: int = DEFAULT_MAX_PAGES) -> Dict:
+        """
+        List catalogs in the Databricks workspace, following up to max_pages pages.
+        Listings that start from the first page are cached for LIST_CACHE_TTL_SECONDS.
+        """
         if page_token:
-            params["page_token"] = page_token
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+            return collect_pages(self._iter_catalog_pages(page_token), "catalogs", max_pages)
+        catalogs = self.list_cache.get(max_pages)
+        if catalogs is None:
+            catalogs = collect_pages(self._iter_catalog_pages(), "catalogs", max_pages)
+            self.list_cache.set(max_pages, catalogs)
+        return catalogs
+
+    def invalidate(self) -> None:
+        """Drop cached listings so the next call sees the latest catalogs."""
+        self.list_cache.clear()
+
+    def _iter_catalog_pages(self, page_token: Optional[str] = None) -> Iterator[Dict]:
+        return iter_pages(self.base_url, page_token=page_token)
 
     def create_catalog(
         self,
         name: str,
         comment: str = "",
         connection_name: str = "",
-        options: Optional[dict] = None,
-        properties: Optional[dict] = None,
+        options: Optional[Dict[str, str]] = None,
+        properties: Optional[Dict[str, str]] = None,
         provider_name: str = "",
         share_name: str = "",
         storage_root: str = ""
     ) -> Dict:
-        url = f"{self.host}/api/2.1/unity-catalog/catalogs"
-        payload = {"name": name}
-        if comment:
-            payload["comment"] = comment
-        if connection_name:
-            payload["connection_name"] = connection_name
-        if options is not None and isinstance(options, dict) and options:
-            payload["options"] = options
-        if properties is not None and isinstance(properties, dict) and properties:
-            payload["properties"] = properties
-        if provider_name:
-            payload["provider_name"] = provider_name
-        if share_name:
-            payload["share_name"] = share_name
-        if storage_root:
-            payload["storage_root"] = storage_root
-        response = requests.post(url, headers=self.headers, json=payload)
-        response.raise_for_status()
-        return response.json()
+        payload = CatalogCreate(
+            name=name,
+            comment=comment,
+            connection_name=connection_name,
+            options=options,
+            properties=properties,
+            provider_name=provider_name,
+            share_name=share_name,
+            storage_root=storage_root,
+        )
+        catalog = self.request("POST", data=payload.to_json())
+        self.invalidate()
+        self.info_cache.pop(payload.name, None)
+        return catalog
 
     def delete_catalog(self, name: str, force: bool = False) -> Dict:
         """Delete a catalog in Databricks. Use force=True to force deletion."""
-        url = f"{self.host}/api/2.1/unity-catalog/catalogs/{name}"
         params = {"force": "true"} if force else {}
-        response = requests.delete(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        result = self.request("DELETE", f"/{name}", params=params)
+        self.invalidate()
+        self.info_cache.pop(name, None)
+        return result
 
     def get_catalog_info(self, catalog_name: str) -> Dict:
-        catalogs = self.list_catalogs()
-        catalog = next((c for c in catalogs.get("catalogs", []) if c["name"] == catalog_name), None)
-        if not catalog:
-            raise ValueError(f"Catalog {catalog_name} not found")
-        return catalog
+        """Get information about a specific catalog (cached for INFO_CACHE_TTL_SECONDS)."""
+        return cached_lookup(self.info_cache, catalog_name, lambda: self._get_catalog_info(catalog_name))
+
+    def _get_catalog_info(self, catalog_name: str) -> Dict:
+        return self.request("GET", f"/{catalog_name}")
 
 # --- Lazy Initialization of the client ---
 _catalog_client_instance = None
@@ -92,26 +95,27 @@ def get_catalog_client():
 
 def mcp_tools(mcp):
     @mcp.tool()
-    def list_catalogs(page_token: Optional[str] = None) -> Dict:
+    @handle_databricks_errors("list catalogs")
+    def list_catalogs(page_token: Optional[str] = None, max_pages: int = DEFAULT_MAX_PAGES) -> Dict:
         """
         List all catalogs in the Databricks workspace, with pagination support.
         Args:
             page_token (str, optional): Token for next page of results
+            max_pages (int, optional): Maximum number of pages to fetch in this call
         Returns:
-            Dict: Response from Databricks API, including 'catalogs' and 'next_page_token'
+            Dict: Response from Databricks API, including 'catalogs' and, if more
+                  results remain, 'next_page_token'
         """
-        try:
-            return get_catalog_client().list_catalogs(page_token=page_token)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to list catalogs: {str(e)}")
+        return get_catalog_client().list_catalogs(page_token=page_token, max_pages=max_pages)
 
     @mcp.tool()
+    @handle_databricks_errors("create catalog")
     def create_catalog(
         name: str,
         comment: str = "",
         connection_name: str = "",
-        options: Optional[dict] = None,
-        properties: Optional[dict] = None,
+        options: Optional[Dict[str, str]] = None,
+        properties: Optional[Dict[str, str]] = None,
         provider_name: str = "",
         share_name: str = "",
         storage_root: str = ""
@@ -129,29 +133,19 @@ def mcp_tools(mcp):
             share_name (str, opcional): Nome do share
             storage_root (str, opcional): URL raiz de armazenamento
         """
-        try:
-            return get_catalog_client().create_catalog(
-                name=name,
-                comment=comment,
-                connection_name=connection_name,
-                options=options,
-                properties=properties,
-                provider_name=provider_name,
-                share_name=share_name,
-                storage_root=storage_root
-            )
-        except requests.exceptions.HTTPError as e:
-            if e.response is not None:
-                try:
-                    detail = e.response.json()
-                except Exception:
-                    detail = e.response.text
-                raise Exception(f"Failed to create catalog: {detail}")
-            raise Exception(f"Failed to create catalog: {str(e)}")
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to create catalog: {str(e)}")
+        return get_catalog_client().create_catalog(
+            name=name,
+            comment=comment,
+            connection_name=connection_name,
+            options=options,
+            properties=properties,
+            provider_name=provider_name,
+            share_name=share_name,
+            storage_root=storage_root
+        )
 
     @mcp.tool()
+    @handle_databricks_errors("delete catalog")
     def delete_catalog(name: str, force: bool = False) -> Dict:
         """
         Deleta um catálogo no Databricks. Use force=True para forçar a exclusão mesmo se houver dependências.
@@ -159,16 +153,11 @@ def mcp_tools(mcp):
             name (str): Nome do catálogo a ser deletado
             force (bool, opcional): Se True, força a exclusão (default: False)
         """
-        try:
-            return get_catalog_client().delete_catalog(name, force=force)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to delete catalog: {str(e)}")
+        return get_catalog_client().delete_catalog(name, force=force)
 
     @mcp.resource("catalog://{catalog_name}")
+    @handle_databricks_errors("get catalog info")
     def get_catalog_info(catalog_name: str) -> Dict:
-        try:
-            return get_catalog_client().get_catalog_info(catalog_name)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to get catalog info: {str(e)}")
+        return get_catalog_client().get_catalog_info(catalog_name)
 
     return mcp
\ No newline at end of file
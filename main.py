@@ -4,12 +4,11 @@ Databricks MCP Server.
 
 import argparse
 import os
+from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
-from catalogs import mcp_tools as catalogs_tools
-from schemas import mcp_tools as schemas_tools
-from resources import mcp_tools as resources_tools
-from queries import mcp_tools as queries_tools
-from tables import mcp_tools as tables_tools
+
+# Load environment variables once, before any client module reads them
+load_dotenv()
 
 # Note: This argument parsing might not work as expected if the runner
 # (e.g., 'mcp run') does not forward unknown arguments to the script.
@@ -24,6 +23,14 @@ if args.db_host:
 if args.db_token:
     os.environ['DATABRICKS_TOKEN'] = args.db_token
 
+# The client modules read the connection settings on import (see _config.py),
+# so they are imported only once the environment is final.
+from catalogs import mcp_tools as catalogs_tools
+from schemas import mcp_tools as schemas_tools
+from resources import mcp_tools as resources_tools
+from queries import mcp_tools as queries_tools
+from tables import mcp_tools as tables_tools
+
 mcp = FastMCP("Databricks MCP")
 catalogs_tools(mcp)
 schemas_tools(mcp)
@@ -6,80 +6,130 @@ consultas SQL, monitorar seu status de forma assíncrona e buscar os resultados.
 Ele abstrai a complexidade do polling e do tratamento de resultados, que podem
 ser retornados diretamente (inline) ou através de links externos (external_links).
 """
-import os
 import time
+import asyncio
 import logging
-from typing import Dict
+from typing import Dict, List
 
+import orjson
 import requests
-from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+from _base import BaseDatabricksClient
+from _http import MAX_RETRIES, RETRY_STATUS_CODES, get_executor, retry_delay
+from resources import get_resources_client
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    import httpx
+except ImportError:  # Optional: chunk downloads fall back to a thread pool
+    httpx = None
+
 # Configuração do logger
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+# httpx logs every request URL at INFO; the external links are pre-signed, so
+# their query strings are credentials and must not reach the log
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Errors translated into a tool failure by execute_sql_query
+REQUEST_ERRORS = (requests.exceptions.RequestException, ValueError)
+if httpx is not None:
+    REQUEST_ERRORS += (httpx.HTTPError,)
+
+# Upper bound on in-flight chunk downloads for a single result set; also the
+# connection pool size, so no download waits on the pool
+MAX_CONCURRENT_CHUNK_FETCHES = 32
+# Per-request timeouts for chunk downloads (chunks can be tens of MB)
+CHUNK_CONNECT_TIMEOUT_SECONDS = 10
+CHUNK_READ_TIMEOUT_SECONDS = 60
 
-# Load environment variables
-load_dotenv()
+# Server-side wait on submission (the API accepts 0 or 5-50 seconds)
+STATEMENT_WAIT_TIMEOUT_SECONDS = 10
+# Longer wait used while the warehouse is still starting up
+COLD_START_WAIT_TIMEOUT_SECONDS = 50
+# Client-side backoff between status polls once the server wait has elapsed
+INITIAL_POLL_INTERVAL_SECONDS = 0.5
+MAX_POLL_INTERVAL_SECONDS = 5
 
 
-class DatabricksQueryClient:
+class DatabricksQueryClient(BaseDatabricksClient):
     """Client for the Databricks Statement Execution API."""
 
-    def __init__(self):
-        self.host = os.getenv("DATABRICKS_HOST")
-        self.token = os.getenv("DATABRICKS_TOKEN")
-        if not self.host or not self.token:
-            raise ValueError(
-                "DATABRICKS_HOST and DATABRICKS_TOKEN are required"
-            )
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
-        # Note: This API version is 2.0
-        self.base_url = f"{self.host}/api/2.0/sql/statements"
+    # Note: This API version is 2.0
+    API_PATH = "/api/2.0/sql/statements"
+
+    def execute_statement(
+        self, warehouse_id: str, statement: str, wait_timeout_seconds: int = STATEMENT_WAIT_TIMEOUT_SECONDS
+    ) -> Dict:
+        """
+        Submits a SQL statement for execution.
 
-    def execute_statement(self, warehouse_id: str, statement: str) -> Dict:
-        """Submits a SQL statement for execution."""
+        The server holds the request open for up to `wait_timeout_seconds`, so
+        short queries come back already finished; longer ones keep running
+        (on_wait_timeout=CONTINUE) and must be polled with get_statement.
+        """
         payload = {
             "warehouse_id": warehouse_id,
             "statement": statement,
-            "wait_timeout": "0s",  # Returns immediately
+            "wait_timeout": f"{wait_timeout_seconds}s",
+            "on_wait_timeout": "CONTINUE",
             "disposition": "EXTERNAL_LINKS" # Recommended for fetching results
         }
         logger.debug(f"Submitting statement to {self.base_url}")
-        response = requests.post(self.base_url, headers=self.headers, json=payload)
-        response.raise_for_status()
-        return response.json()
+        return self.request("POST", json=payload)
 
     def get_statement(self, statement_id: str) -> Dict:
         """Gets the status of a statement execution."""
-        url = f"{self.base_url}/{statement_id}"
-        logger.debug(f"Getting statement status from {url}")
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        logger.debug(f"Getting statement status from {self.base_url}/{statement_id}")
+        return self.request("GET", f"/{statement_id}")
 
-    def _fetch_results_from_links(self, result: Dict) -> Dict:
+    def get_result_chunk(self, statement_id: str, chunk_index: int) -> Dict:
+        """Gets a result chunk of a finished statement, including its external links."""
+        logger.debug(f"Getting chunk {chunk_index} of statement {statement_id}")
+        return self.request("GET", f"/{statement_id}/result/chunks/{chunk_index}")
+
+    def _fetch_results_from_links(self, statement_id: str, result: Dict, manifest: Dict) -> Dict:
         """
         Busca e consolida os dados de resultados a partir de links externos.
-        Se os dados já estiverem no formato 'inline', retorna-os diretamente.
+        Se os dados já estiverem no formato 'inline', retorna-os diretamente,
+        e resultados vazios retornam sem nenhuma requisição HTTP.
         """
+        if manifest.get("total_row_count") == 0 or (
+            not result.get("external_links") and not result.get("data_array")
+        ):
+            # Empty result (DDL, metadata queries, ...): nothing to fetch
+            return {"data_array": [], "row_count": 0}
         if "external_links" not in result:
             # If data is inline, just return it
             return result
 
-        all_data = []
-        # Use a new requests.Session for potential connection reuse
-        with requests.Session() as session:
-            for link_info in result["external_links"]:
-                # The external link does not require auth headers
-                logger.info(f"Fetching results from external link (chunk {link_info['chunk_index']})...")
-                response = session.get(link_info["external_link"])
-                response.raise_for_status()
-                # The data is returned as a JSON array of arrays
-                all_data.extend(response.json())
+        links = self._resolve_links(statement_id, result, manifest)
+        if httpx is not None:
+            chunks = _run_sync(self._fetch_all(links))
+        else:
+            chunks = list(get_executor().map(self._fetch_chunk, links))
+
+        # The manifest gives every chunk's position in the result set, so the
+        # rows are placed by offset into a single pre-sized list
+        if manifest.get("chunks"):
+            chunk_info = {chunk["chunk_index"]: chunk for chunk in manifest["chunks"]}
+            total_row_count = manifest["total_row_count"]
+        else:
+            # No chunk list in the manifest: each link carries its own position
+            chunk_info = {link["chunk_index"]: link for link in links}
+            total_row_count = max(link["row_offset"] + link["row_count"] for link in links)
+        all_data = [None] * total_row_count
+        for link_info, chunk in zip(links, chunks):
+            info = chunk_info[link_info["chunk_index"]]
+            if len(chunk) != info["row_count"]:
+                # A short or long chunk would silently shift every row after it
+                raise ValueError(
+                    f"Chunk {link_info['chunk_index']} returned {len(chunk)} rows, "
+                    f"expected {info['row_count']}"
+                )
+            start = info["row_offset"]
+            all_data[start:start + info["row_count"]] = chunk
 
         # Reconstruct the result object to match the INLINE format
         final_result = {
@@ -88,6 +138,112 @@ class DatabricksQueryClient:
         }
         return final_result
 
+    def _resolve_links(self, statement_id: str, result: Dict, manifest: Dict) -> List[Dict]:
+        """
+        Retorna os links externos de todos os chunks do resultado.
+        A resposta do statement traz apenas os links do primeiro chunk; os
+        demais, listados no manifest, são obtidos em paralelo pelo endpoint
+        /result/chunks/{chunk_index}.
+        """
+        links = {link["chunk_index"]: link for link in result["external_links"]}
+        missing = [
+            chunk["chunk_index"] for chunk in manifest.get("chunks", []) if chunk["chunk_index"] not in links
+        ]
+        fetch_chunk = lambda chunk_index: self.get_result_chunk(statement_id, chunk_index)
+        for chunk in get_executor().map(fetch_chunk, missing):
+            for link in chunk.get("external_links", []):
+                links[link["chunk_index"]] = link
+        return list(links.values())
+
+    def _fetch_chunk(self, link_info: Dict) -> List:
+        """Baixa um único chunk de link externo usando a sessão compartilhada."""
+        logger.info(f"Fetching results from external link (chunk {link_info['chunk_index']})...")
+        # The external link is pre-signed: strip the session's default
+        # auth headers so the workspace token is never sent to storage
+        response = self.session.get(
+            link_info["external_link"],
+            headers={"Authorization": None, "Content-Type": None},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _fetch_all(self, links: List[Dict]) -> List[List]:
+        """
+        Baixa todos os chunks de links externos em paralelo, multiplexados
+        sobre HTTP/2. Retorna os chunks na mesma ordem de `links`.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNK_FETCHES)
+        limits = httpx.Limits(
+            max_connections=MAX_CONCURRENT_CHUNK_FETCHES,
+            max_keepalive_connections=MAX_CONCURRENT_CHUNK_FETCHES,
+        )
+        # The semaphore already bounds pool usage, so waiting for a connection never times out
+        timeout = httpx.Timeout(CHUNK_CONNECT_TIMEOUT_SECONDS, read=CHUNK_READ_TIMEOUT_SECONDS, pool=None)
+        # The external links are pre-signed and must not carry the workspace token.
+        # httpx already sends Accept-Encoding for every coding it can decode.
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=timeout) as client:
+
+            async def fetch(link_info: Dict) -> List:
+                async with semaphore:
+                    logger.info(f"Fetching results from external link (chunk {link_info['chunk_index']})...")
+                    for attempt in range(MAX_RETRIES + 1):
+                        try:
+                            response = await client.get(link_info["external_link"])
+                        except httpx.TransportError as e:
+                            # Connection resets and timeouts are retried like 5xx responses
+                            if attempt == MAX_RETRIES:
+                                raise
+                            delay = retry_delay({}, attempt)
+                            reason = repr(e)
+                        else:
+                            if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                                response.raise_for_status()
+                                # The data is returned as a JSON array of arrays; orjson
+                                # parses the raw bytes without an intermediate str copy
+                                return orjson.loads(response.content)
+                            delay = retry_delay(response.headers, attempt)
+                            reason = f"HTTP {response.status_code}"
+                        logger.warning(
+                            f"Chunk {link_info['chunk_index']} failed with {reason}; "
+                            f"retrying in {delay:.1f}s (attempt {attempt + 1}/{MAX_RETRIES})"
+                        )
+                        await asyncio.sleep(delay)
+
+            return await asyncio.gather(*(fetch(link_info) for link_info in links))
+
+
+def _run_sync(coro):
+    """
+    Runs a coroutine to completion from synchronous code.
+
+    FastMCP calls synchronous tools from inside its event loop, where
+    asyncio.run() is not allowed, so in that case the coroutine is run on
+    a fresh loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return get_executor().submit(asyncio.run, coro).result()
+
+
+def ensure_warehouse_running(warehouse_id: str) -> bool:
+    """
+    Verifica o estado do SQL Warehouse antes de submeter a query: falha
+    rapidamente se ele não puder executar queries e inicia-o se estiver parado,
+    em vez de esconder o tempo de cold start dentro do polling.
+    Retorna True se o warehouse ainda não estiver em execução (cold start).
+    """
+    resources_client = get_resources_client()
+    state = resources_client.get_warehouse(warehouse_id).get("state")
+    logger.info(f"SQL Warehouse {warehouse_id} state: {state}")
+    if state in ["DELETING", "DELETED"]:
+        raise ValueError(f"SQL Warehouse {warehouse_id} is {state} and cannot run queries")
+    if state in ["STOPPED", "STOPPING"]:
+        logger.info(f"Starting SQL Warehouse {warehouse_id}; the query will run once it is up")
+        resources_client.start_warehouse(warehouse_id)
+    return state != "RUNNING"
+
 
 # --- Lazy Initialization of the client ---
 _query_client_instance = None
@@ -126,15 +282,19 @@ def mcp_tools(mcp: FastMCP):
         try:
             logger.info(f"Executing SQL query on warehouse {warehouse_id}: \"{sql_query[:100]}...\"")
             client = get_query_client()
-            # 1. Submit the query
-            submission_response = client.execute_statement(warehouse_id, sql_query)
-            statement_id = submission_response["statement_id"]
+            cold_start = ensure_warehouse_running(warehouse_id)
+            # 1. Submit the query, letting the server wait for it to finish
+            start_time = time.time()
+            waits = [COLD_START_WAIT_TIMEOUT_SECONDS] if cold_start else []
+            waits.append(STATEMENT_WAIT_TIMEOUT_SECONDS)
+            wait_timeout = next((wait for wait in waits if wait <= timeout_seconds), 0)
+            status_response = client.execute_statement(warehouse_id, sql_query, wait_timeout)
+            statement_id = status_response["statement_id"]
             logger.info(f"Query submitted. Statement ID: {statement_id}")
 
-            # 2. Poll for the result
-            start_time = time.time()
-            while time.time() - start_time < timeout_seconds:
-                status_response = client.get_statement(statement_id)
+            # 2. Poll for the result if it is still running
+            poll_interval = INITIAL_POLL_INTERVAL_SECONDS
+            while True:
                 status = status_response["status"]["state"]
                 logger.debug(f"Polling statement {statement_id}. Current status: {status}")
 
@@ -144,7 +304,7 @@ def mcp_tools(mcp: FastMCP):
                     result = status_response.get("result", {})
                     manifest = status_response.get("manifest", {})
                     
-                    final_data = client._fetch_results_from_links(result)
+                    final_data = client._fetch_results_from_links(statement_id, result, manifest)
                     final_data["schema"] = manifest.get("schema", {})
                     logger.info(f"Successfully fetched {final_data.get('row_count', 0)} rows.")
                     return final_data
@@ -152,13 +312,18 @@ def mcp_tools(mcp: FastMCP):
                     error_msg = status_response.get('status', {}).get('error', {}).get('message', 'Unknown error')
                     logger.error(f"Query {statement_id} failed with status '{status}'. Reason: {error_msg}")
                     raise Exception(f"Query failed with status '{status}': {error_msg}")
-                
-                time.sleep(2) # Wait 2 seconds before polling again
+
+                remaining = timeout_seconds - (time.time() - start_time)
+                if remaining <= 0:
+                    break
+                time.sleep(min(poll_interval, remaining))
+                poll_interval = min(poll_interval * 2, MAX_POLL_INTERVAL_SECONDS)
+                status_response = client.get_statement(statement_id)
 
             logger.warning(f"Query {statement_id} timed out after {timeout_seconds} seconds.")
             raise TimeoutError(f"Query timed out after {timeout_seconds} seconds.")
 
-        except (requests.exceptions.RequestException, ValueError) as e:
+        except REQUEST_ERRORS as e:
             logger.error(f"API request failed during query execution: {e}", exc_info=True)
             raise Exception(f"API request failed during query execution: {e}")
 
@@ -1,39 +1,54 @@
 """
 Databricks Resources Module: List compute resources like SQL Warehouses.
 """
-import os
 from typing import Dict
 
-import requests
-from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
-# Load environment variables
-load_dotenv()
+from _base import BaseDatabricksClient
+from _cache import LIST_CACHE_TTL_SECONDS, TTLCache
+from _errors import handle_databricks_errors
 
 
-class DatabricksResourcesClient:
+class DatabricksResourcesClient(BaseDatabricksClient):
     """Client to interact with the Databricks Resources API (e.g., SQL Warehouses)."""
 
+    # Note: This API version is 2.0, different from Unity Catalog's 2.1
+    API_PATH = "/api/2.0/sql/warehouses"
+
     def __init__(self):
-        self.host = os.getenv("DATABRICKS_HOST")
-        self.token = os.getenv("DATABRICKS_TOKEN")
-        if not self.host or not self.token:
-            raise ValueError(
-                "DATABRICKS_HOST and DATABRICKS_TOKEN environment variables are required"
-            )
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
-        # Note: This API version is 2.0, different from Unity Catalog's 2.1
-        self.base_url = f"{self.host}/api/2.0/sql/warehouses"
+        super().__init__()
+        self.list_cache = TTLCache(maxsize=1, ttl=LIST_CACHE_TTL_SECONDS)
 
     def list_warehouses(self) -> Dict:
-        """List all available SQL Warehouses in the workspace."""
-        response = requests.get(self.base_url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        """List all available SQL Warehouses in the workspace (cached for LIST_CACHE_TTL_SECONDS)."""
+        warehouses = self.list_cache.get("warehouses")
+        if warehouses is None:
+            warehouses = self.request("GET")
+            self.list_cache.set("warehouses", warehouses)
+        return warehouses
+
+    def get_warehouse(self, warehouse_id: str) -> Dict:
+        """Get a SQL Warehouse from the (cached) listing, refreshing once if it is not there."""
+        for refresh in (False, True):
+            if refresh:
+                self.invalidate()
+            warehouse = next(
+                (w for w in self.list_warehouses().get("warehouses", []) if w.get("id") == warehouse_id), None
+            )
+            if warehouse is not None:
+                return warehouse
+        raise ValueError(f"SQL Warehouse {warehouse_id} not found")
+
+    def start_warehouse(self, warehouse_id: str) -> Dict:
+        """Start a stopped SQL Warehouse."""
+        result = self.request("POST", f"/{warehouse_id}/start")
+        self.invalidate()
+        return result
+
+    def invalidate(self) -> None:
+        """Drop the cached listing so the next call sees the latest warehouses."""
+        self.list_cache.clear()
 
 
 # --- Lazy Initialization of the client ---
@@ -51,11 +66,9 @@ def mcp_tools(mcp: FastMCP):
     """Registers resource-related tools with the MCP server."""
 
     @mcp.tool()
+    @handle_databricks_errors("list SQL Warehouses")
     def list_sql_warehouses() -> Dict:
         """Lists all available SQL Warehouses to find a 'warehouse_id' for running queries."""
-        try:
-            return get_resources_client().list_warehouses()
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to list SQL Warehouses: {e}")
+        return get_resources_client().list_warehouses()
 
     return mcp
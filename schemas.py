@@ -1,81 +1,73 @@
 """
 Databricks Schemas Module: CRUD operations for Unity Catalog schemas.
 """
-import os
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional
 
-import requests
-from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
-# Load environment variables
-load_dotenv()
+from _base import BaseDatabricksClient
+from _cache import INFO_CACHE_MAXSIZE, INFO_CACHE_TTL_SECONDS, TTLCache, cached_lookup
+from _errors import handle_databricks_errors
+from _http import fetch_many
+from _models import SchemaCreate, SchemaUpdate
+from _paging import DEFAULT_MAX_PAGES, collect_pages, iter_pages
 
 
-class DatabricksSchemaClient:
+class DatabricksSchemaClient(BaseDatabricksClient):
     """Client to interact with the Databricks Schemas API."""
 
+    API_PATH = "/api/2.1/unity-catalog/schemas"
+
     def __init__(self):
-        self.host = os.getenv("DATABRICKS_HOST")
-        self.token = os.getenv("DATABRICKS_TOKEN")
-        if not self.host or not self.token:
-            raise ValueError(
-                "DATABRICKS_HOST and DATABRICKS_TOKEN environment variables are required"
-            )
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
-        self.base_url = f"{self.host}/api/2.1/unity-catalog/schemas"
-
-    def list_schemas(self, catalog_name: str) -> Dict:
-        """List all schemas in a specific catalog."""
+        super().__init__()
+        self.info_cache = TTLCache(maxsize=INFO_CACHE_MAXSIZE, ttl=INFO_CACHE_TTL_SECONDS)
+
+    def list_schemas(
+        self, catalog_name: str, page_token: Optional[str] = None, max_pages: int = DEFAULT_MAX_PAGES
+    ) -> Dict:
+        """List schemas in a specific catalog, following up to max_pages pages."""
+        return collect_pages(self._iter_schema_pages(catalog_name, page_token), "schemas", max_pages)
+
+    def _iter_schema_pages(self, catalog_name: str, page_token: Optional[str] = None) -> Iterator[Dict]:
         params = {"catalog_name": catalog_name}
-        response = requests.get(self.base_url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return iter_pages(self.base_url, params, page_token)
 
     def create_schema(
-        self, catalog_name: str, name: str, comment: Optional[str] = None, properties: Optional[dict] = None
+        self, catalog_name: str, name: str, comment: Optional[str] = None, properties: Optional[Dict[str, str]] = None
     ) -> Dict:
         """Create a new schema in a catalog."""
-        payload = {"name": name, "catalog_name": catalog_name}
-        if comment:
-            payload["comment"] = comment
-        if properties:
-            payload["properties"] = properties
-        response = requests.post(self.base_url, headers=self.headers, json=payload)
-        response.raise_for_status()
-        return response.json()
+        payload = SchemaCreate(catalog_name=catalog_name, name=name, comment=comment, properties=properties)
+        schema = self.request("POST", data=payload.to_json())
+        self.info_cache.pop(f"{payload.catalog_name}.{payload.name}", None)
+        return schema
 
     def get_schema(self, full_name: str) -> Dict:
-        """Get information about a specific schema."""
-        url = f"{self.base_url}/{full_name}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        """Get information about a specific schema (cached for INFO_CACHE_TTL_SECONDS)."""
+        return cached_lookup(self.info_cache, full_name, lambda: self._get_schema(full_name))
+
+    def _get_schema(self, full_name: str) -> Dict:
+        return self.request("GET", f"/{full_name}")
+
+    def get_schemas(self, full_names: List[str]) -> Dict[str, Dict]:
+        """Get several schemas concurrently, keyed by full name (see _http.fetch_many)."""
+        return fetch_many(self.get_schema, full_names)
 
     def update_schema(
-        self, full_name: str, new_name: Optional[str] = None, comment: Optional[str] = None, properties: Optional[dict] = None
+        self, full_name: str, new_name: Optional[str] = None, comment: Optional[str] = None, properties: Optional[Dict[str, str]] = None
     ) -> Dict:
         """Update an existing schema."""
-        url = f"{self.base_url}/{full_name}"
-        payload = {}
-        if new_name:
-            payload["new_name"] = new_name
-        if comment:
-            payload["comment"] = comment
-        if properties:
-            payload["properties"] = properties
-        response = requests.patch(url, headers=self.headers, json=payload)
-        response.raise_for_status()
-        return response.json()
+        payload = SchemaUpdate(new_name=new_name, comment=comment, properties=properties)
+        schema = self.request("PATCH", f"/{full_name}", data=payload.to_json())
+        self.info_cache.pop(full_name, None)
+        if payload.new_name:
+            catalog_name = full_name.split(".", 1)[0]
+            self.info_cache.pop(f"{catalog_name}.{payload.new_name}", None)
+        return schema
 
     def delete_schema(self, full_name: str) -> Dict:
         """Delete a schema."""
-        url = f"{self.base_url}/{full_name}"
-        response = requests.delete(url, headers=self.headers)
-        response.raise_for_status()
+        self.request("DELETE", f"/{full_name}")
+        self.info_cache.pop(full_name, None)
         # A API de delete retorna um corpo vazio em caso de sucesso
         return {"status": "success", "message": f"Schema {full_name} deleted."}
 
@@ -95,22 +87,26 @@ def mcp_tools(mcp: FastMCP):
     """Registers schema-related tools with the MCP server."""
 
     @mcp.tool()
-    def list_schemas(catalog_name: str) -> Dict:
+    @handle_databricks_errors("list schemas")
+    def list_schemas(
+        catalog_name: str, page_token: Optional[str] = None, max_pages: int = DEFAULT_MAX_PAGES
+    ) -> Dict:
         """
         List all schemas in a specific catalog.
         Args:
             catalog_name (str): The name of the catalog.
+            page_token (str, optional): Token for next page of results.
+            max_pages (int, optional): Maximum number of pages to fetch in this call.
         Returns:
-            Dict: Response from Databricks API, including 'schemas'.
+            Dict: Response from Databricks API, including 'schemas' and, if more
+                  results remain, 'next_page_token'.
         """
-        try:
-            return get_schema_client().list_schemas(catalog_name)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to list schemas: {e}")
+        return get_schema_client().list_schemas(catalog_name, page_token, max_pages)
 
     @mcp.tool()
+    @handle_databricks_errors("create schema")
     def create_schema(
-        catalog_name: str, name: str, comment: Optional[str] = None, properties: Optional[dict] = None
+        catalog_name: str, name: str, comment: Optional[str] = None, properties: Optional[Dict[str, str]] = None
     ) -> Dict:
         """
         Create a new schema in a catalog.
@@ -120,14 +116,12 @@ def mcp_tools(mcp: FastMCP):
             comment (str, optional): A comment for the schema.
             properties (dict, optional): A dictionary of key-value properties.
         """
-        try:
-            return get_schema_client().create_schema(catalog_name, name, comment, properties)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to create schema: {e}")
+        return get_schema_client().create_schema(catalog_name, name, comment, properties)
 
     @mcp.tool()
+    @handle_databricks_errors("update schema")
     def update_schema(
-        full_name: str, new_name: Optional[str] = None, comment: Optional[str] = None, properties: Optional[dict] = None
+        full_name: str, new_name: Optional[str] = None, comment: Optional[str] = None, properties: Optional[Dict[str, str]] = None
     ) -> Dict:
         """
         Update an existing schema.
@@ -137,26 +131,33 @@ def mcp_tools(mcp: FastMCP):
             comment (str, optional): A new comment for the schema.
             properties (dict, optional): A new set of key-value properties.
         """
-        try:
-            return get_schema_client().update_schema(full_name, new_name, comment, properties)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to update schema: {e}")
+        return get_schema_client().update_schema(full_name, new_name, comment, properties)
 
     @mcp.tool()
+    @handle_databricks_errors("delete schema")
     def delete_schema(full_name: str) -> Dict:
         """Delete a schema. Args: full_name (str): The full name of the schema (e.g., 'catalog_name.schema_name')."""
-        try:
-            return get_schema_client().delete_schema(full_name)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to delete schema: {e}")
+        return get_schema_client().delete_schema(full_name)
+
+    @mcp.tool()
+    @handle_databricks_errors("get schemas info")
+    def get_schemas_info(full_names: List[str]) -> Dict:
+        """
+        Get information about several schemas in one call, fetched concurrently.
+        Prefer this over repeated single-schema lookups; results are also cached
+        for later lookups of the same schemas.
+        Args:
+            full_names (List[str]): Full schema names (e.g., ['catalog_name.schema_name']).
+        Returns:
+            Dict: Schema information keyed by full name; lookups that failed map to {'error': ...}.
+        """
+        return get_schema_client().get_schemas(full_names)
 
     @mcp.resource("schema://{catalog_name}.{schema_name}")
+    @handle_databricks_errors("get schema info")
     def get_schema_info(catalog_name: str, schema_name: str) -> Dict:
         """Get information about a specific schema."""
         full_name = f"{catalog_name}.{schema_name}"
-        try:
-            return get_schema_client().get_schema(full_name)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to get schema info: {e}")
+        return get_schema_client().get_schema(full_name)
 
     return mcp
\ No newline at end of file
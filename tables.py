@@ -2,59 +2,61 @@
 Databricks Tables Module: CRUD operations for Unity Catalog tables.
 """
 
-from typing import List, Dict, Optional
-import requests
-import os
-from dotenv import load_dotenv
+from typing import Any, List, Dict, Iterator, Optional
 from mcp.server.fastmcp import FastMCP
 
-# Load environment variables
-load_dotenv()
+from _base import BaseDatabricksClient
+from _cache import INFO_CACHE_MAXSIZE, INFO_CACHE_TTL_SECONDS, TTLCache, cached_lookup
+from _errors import handle_databricks_errors
+from _http import fetch_many
+from _models import TableCreate, TableUpdate
+from _paging import DEFAULT_MAX_PAGES, collect_pages, iter_pages
+
+class DatabricksTableClient(BaseDatabricksClient):
+    API_PATH = "/api/2.1/unity-catalog/tables"
 
-class DatabricksTableClient:
     def __init__(self):
-        self.host = os.getenv("DATABRICKS_HOST")
-        self.token = os.getenv("DATABRICKS_TOKEN")
-        if not self.host or not self.token:
-            raise ValueError("DATABRICKS_HOST and DATABRICKS_TOKEN environment variables are required")
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
-        self.base_url = f"{self.host}/api/2.1/unity-catalog/tables"
-
-    def list_tables(self, catalog_name: str, schema_name: str) -> Dict:
-        """List all tables in a specific schema."""
+        super().__init__()
+        self.info_cache = TTLCache(maxsize=INFO_CACHE_MAXSIZE, ttl=INFO_CACHE_TTL_SECONDS)
+
+    def list_tables(
+        self, catalog_name: str, schema_name: str, page_token: Optional[str] = None, max_pages: int = DEFAULT_MAX_PAGES
+    ) -> Dict:
+        """List tables in a specific schema, following up to max_pages pages."""
+        return collect_pages(self._iter_table_pages(catalog_name, schema_name, page_token), "tables", max_pages)
+
+    def _iter_table_pages(self, catalog_name: str, schema_name: str, page_token: Optional[str] = None) -> Iterator[Dict]:
         params = {"catalog_name": catalog_name, "schema_name": schema_name}
-        response = requests.get(self.base_url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return iter_pages(self.base_url, params, page_token)
 
     def get_table(self, full_name: str) -> Dict:
-        """Get information about a specific table."""
-        url = f"{self.base_url}/{full_name}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        """Get information about a specific table (cached for INFO_CACHE_TTL_SECONDS)."""
+        return cached_lookup(self.info_cache, full_name, lambda: self._get_table(full_name))
+
+    def _get_table(self, full_name: str) -> Dict:
+        return self.request("GET", f"/{full_name}")
+
+    def get_tables(self, full_names: List[str]) -> Dict[str, Dict]:
+        """Get several tables concurrently, keyed by full name (see _http.fetch_many)."""
+        return fetch_many(self.get_table, full_names)
 
-    def create_table(self, table_info: Dict) -> Dict:
+    def create_table(self, table_info: Dict[str, Any]) -> Dict:
         """Create a new table in a schema."""
-        response = requests.post(self.base_url, headers=self.headers, json=table_info)
-        response.raise_for_status()
-        return response.json()
+        payload = TableCreate(**table_info)
+        table = self.request("POST", data=payload.to_json())
+        self.info_cache.pop(payload.full_name, None)
+        return table
 
-    def update_table(self, full_name: str, updates: Dict) -> Dict:
+    def update_table(self, full_name: str, updates: Dict[str, Any]) -> Dict:
         """Update an existing table."""
-        url = f"{self.base_url}/{full_name}"
-        response = requests.patch(url, headers=self.headers, json=updates)
-        response.raise_for_status()
-        return response.json()
+        table = self.request("PATCH", f"/{full_name}", data=TableUpdate(**updates).to_json())
+        self.info_cache.pop(full_name, None)
+        return table
 
     def delete_table(self, full_name: str) -> Dict:
         """Delete a table."""
-        url = f"{self.base_url}/{full_name}"
-        response = requests.delete(url, headers=self.headers)
-        response.raise_for_status()
+        self.request("DELETE", f"/{full_name}")
+        self.info_cache.pop(full_name, None)
         return {"status": "success", "message": f"Table {full_name} deleted."}
 
 # --- Lazy Initialization of the client ---
@@ -71,64 +73,73 @@ def mcp_tools(mcp: FastMCP):
     """Registers table-related tools with the MCP server."""
 
     @mcp.tool()
-    def list_tables(catalog_name: str, schema_name: str) -> Dict:
+    @handle_databricks_errors("list tables")
+    def list_tables(
+        catalog_name: str, schema_name: str, page_token: Optional[str] = None, max_pages: int = DEFAULT_MAX_PAGES
+    ) -> Dict:
         """
         List all tables in a specific schema.
         Args:
             catalog_name (str): The name of the catalog.
             schema_name (str): The name of the schema.
+            page_token (str, optional): Token for next page of results.
+            max_pages (int, optional): Maximum number of pages to fetch in this call.
         Returns:
-            Dict: Response from Databricks API, including 'tables'.
+            Dict: Response from Databricks API, including 'tables' and, if more
+                  results remain, 'next_page_token'.
         """
-        try:
-            return get_table_client().list_tables(catalog_name, schema_name)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to list tables: {e}")
+        return get_table_client().list_tables(catalog_name, schema_name, page_token, max_pages)
 
     @mcp.tool()
-    def create_table(table_info: Dict) -> Dict:
+    @handle_databricks_errors("create table")
+    def create_table(table_info: Dict[str, Any]) -> Dict:
         """
         Create a new table in a schema.
         Args:
             table_info (Dict): A dictionary containing the table information.
         """
-        try:
-            return get_table_client().create_table(table_info)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to create table: {e}")
+        return get_table_client().create_table(table_info)
 
     @mcp.tool()
-    def update_table(full_name: str, updates: Dict) -> Dict:
+    @handle_databricks_errors("update table")
+    def update_table(full_name: str, updates: Dict[str, Any]) -> Dict:
         """
         Update an existing table.
         Args:
             full_name (str): The full name of the table (e.g., 'catalog_name.schema_name.table_name').
             updates (Dict): A dictionary containing the updates to the table.
         """
-        try:
-            return get_table_client().update_table(full_name, updates)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to update table: {e}")
+        return get_table_client().update_table(full_name, updates)
 
     @mcp.tool()
+    @handle_databricks_errors("delete table")
     def delete_table(full_name: str) -> Dict:
         """
         Delete a table.
         Args:
             full_name (str): The full name of the table (e.g., 'catalog_name.schema_name.table_name').
         """
-        try:
-            return get_table_client().delete_table(full_name)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to delete table: {e}")
+        return get_table_client().delete_table(full_name)
+
+    @mcp.tool()
+    @handle_databricks_errors("get tables info")
+    def get_tables_info(full_names: List[str]) -> Dict:
+        """
+        Get information about several tables in one call, fetched concurrently.
+        Prefer this over repeated single-table lookups; results are also cached
+        for later lookups of the same tables.
+        Args:
+            full_names (List[str]): Full table names (e.g., ['catalog_name.schema_name.table_name']).
+        Returns:
+            Dict: Table information keyed by full name; lookups that failed map to {'error': ...}.
+        """
+        return get_table_client().get_tables(full_names)
 
     @mcp.resource("table://{catalog_name}.{schema_name}.{table_name}")
+    @handle_databricks_errors("get table info")
     def get_table_info(catalog_name: str, schema_name: str, table_name: str) -> Dict:
         """Get information about a specific table."""
         full_name = f"{catalog_name}.{schema_name}.{table_name}"
-        try:
-            return get_table_client().get_table(full_name)
-        except (requests.exceptions.RequestException, ValueError) as e:
-            raise Exception(f"Failed to get table info: {e}")
+        return get_table_client().get_table(full_name)
 
     return mcp